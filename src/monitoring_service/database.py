@@ -22,6 +22,7 @@ from raiden.utils.typing import (
     ChainID,
     ChannelID,
     MonitoringServiceAddress,
+    Nonce,
     TokenNetworkAddress,
     TransactionHash,
 )
@@ -95,6 +96,35 @@ class SharedDatabase(BaseDatabase):
         kwargs["reward_proof_signature"] = decode_hex(kwargs["reward_proof_signature"])
         return MonitorRequest(**kwargs)
 
+    def get_monitor_request_nonce(
+        self,
+        token_network_address: TokenNetworkAddress,
+        channel_id: ChannelID,
+        non_closing_signer: Address,
+    ) -> Optional[Nonce]:
+        """Returns only the nonce of the stored monitor request
+
+        Loading the full `MonitorRequest` recovers all signers from their
+        signatures, which is not needed when only comparing nonces.
+        """
+        row = self.conn.execute(
+            """
+                SELECT nonce FROM monitor_request
+                WHERE channel_identifier = ?
+                  AND token_network_address = ?
+                  AND non_closing_signer = ?
+            """,
+            [
+                hex256(channel_id),
+                to_checksum_address(token_network_address),
+                to_checksum_address(non_closing_signer),
+            ],
+        ).fetchone()
+        if row is None:
+            return None
+
+        return Nonce(row["nonce"])
+
     def monitor_request_count(self) -> int:
         return self.conn.execute("SELECT count(*) FROM monitor_request").fetchone()[0]
 
@@ -22,7 +22,7 @@ from raiden.utils.typing import Address, BlockNumber, TokenNetworkAddress, Trans
 from raiden_contracts.constants import CONTRACT_TOKEN_NETWORK, ChannelState
 from raiden_libs.blockchain import get_pessimistic_udc_balance
 from raiden_libs.constants import UDC_SECURITY_MARGIN_FACTOR_MS
-from raiden_libs.contract_info import CONTRACT_MANAGER
+from raiden_libs.contract_info import get_contract_manager
 from raiden_libs.events import (
     Event,
     ReceiveChannelClosedEvent,
@@ -96,7 +96,7 @@ def _first_allowed_block_to_monitor(
     token_network_address: TokenNetworkAddress, channel: Channel, context: Context
 ) -> BlockNumber:
     # Get token_network_contract
-    abi = CONTRACT_MANAGER.get_contract_abi(CONTRACT_TOKEN_NETWORK)
+    abi = get_contract_manager().get_contract_abi(CONTRACT_TOKEN_NETWORK)
     token_network_contract = context.web3.eth.contract(
         abi=abi, address=Address(token_network_address)
     )
@@ -1,18 +1,14 @@
 import collections
 from dataclasses import dataclass, field
 from datetime import MINYEAR, datetime
+from functools import lru_cache
 from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar, cast
 from uuid import UUID
 
 import marshmallow
 import pkg_resources
 import structlog
-from eth_utils import (
-    is_checksum_address,
-    is_same_address,
-    to_canonical_address,
-    to_checksum_address,
-)
+from eth_utils import is_same_address, to_canonical_address, to_checksum_address
 from flask import Flask, Response, request
 from flask_restful import Resource
 from gevent.pywsgi import WSGIServer
@@ -33,6 +29,7 @@ from pathfinding_service.constants import (
     MAX_PATHS_PER_REQUEST,
     MIN_IOU_EXPIRY,
 )
+from pathfinding_service.database import IOU_SCHEMA
 from pathfinding_service.model import IOU
 from pathfinding_service.model.feedback import FeedbackToken
 from pathfinding_service.model.token_network import Path, TokenNetwork
@@ -53,12 +50,25 @@ from raiden_libs.blockchain import get_pessimistic_udc_balance
 from raiden_libs.constants import UDC_SECURITY_MARGIN_FACTOR_PFS
 from raiden_libs.exceptions import ApiException
 from raiden_libs.marshmallow import ChecksumAddress, HexedBytes
+from raiden_libs.utils import is_checksum_address
 
 log = structlog.get_logger(__name__)
 T = TypeVar("T")
 # list stores max 200 last requests
 last_failed_requests: collections.deque = collections.deque([], maxlen=200)
 
+IOU_RESPONSE_SCHEMA = IOU.Schema(exclude=["claimed"])
+
+
+@lru_cache(maxsize=None)
+def get_request_schema(req_class: type) -> marshmallow.Schema:
+    """Returns a schema for `req_class`, creating it only on first use
+
+    Schema instances hold no per-request state, so they can be shared between
+    requests instead of setting up all fields again for each request.
+    """
+    return req_class.Schema()  # type: ignore
+
 
 class PathfinderResource(Resource):
     def __init__(self, pathfinding_service: PathfindingService, api: "PFSApi"):
@@ -85,7 +95,7 @@ class PathfinderResource(Resource):
         if not json:
             raise ApiException("JSON payload expected")
         try:
-            return req_class.Schema().load(json)  # type: ignore
+            return get_request_schema(req_class).load(json)  # type: ignore
         except marshmallow.ValidationError as ex:
             raise exceptions.InvalidRequest(**ex.normalized_messages())
 
@@ -254,7 +264,7 @@ def process_payment(  # pylint: disable=too-many-branches
     active_iou = pathfinding_service.database.get_iou(sender=iou.sender, claimed=False)
     if active_iou:
         if active_iou.expiration_block != iou.expiration_block:
-            raise exceptions.UseThisIOU(iou=active_iou.Schema().dump(active_iou))
+            raise exceptions.UseThisIOU(iou=IOU_SCHEMA.dump(active_iou))
 
         expected_amount = active_iou.amount + service_fee
     else:
@@ -327,7 +337,7 @@ class IOUResource(PathfinderResource):
         self, token_network_address: str  # pylint: disable=unused-argument
     ) -> Tuple[dict, int]:
         try:
-            iou_request = IOURequest.Schema().load(request.args)
+            iou_request = get_request_schema(IOURequest).load(request.args)
         except marshmallow.ValidationError as ex:
             raise exceptions.InvalidRequest(**ex.normalized_messages())
         if not iou_request.is_signature_valid():
@@ -339,7 +349,7 @@ class IOUResource(PathfinderResource):
             sender=iou_request.sender, claimed=False
         )
         if last_iou:
-            last_iou = IOU.Schema(exclude=["claimed"]).dump(last_iou)
+            last_iou = IOU_RESPONSE_SCHEMA.dump(last_iou)
             return {"last_iou": last_iou}, 200
 
         return {"last_iou": None}, 404
@@ -466,9 +476,10 @@ class SuggestPartnerResource(PathfinderResource):
     def get(self, token_network_address: str) -> Tuple[List[Dict[str, Any]], int]:
         token_network = self._validate_token_network_argument(token_network_address)
         # Check cache
+        now = datetime.utcnow()
         cache_key = token_network_address
         cache_entry, cache_timestamp = self.cache.get(cache_key, (None, datetime(MINYEAR, 1, 1)))
-        if cache_timestamp > datetime.utcnow() - CACHE_TIMEOUT_SUGGEST_PARTNER:
+        if cache_timestamp > now - CACHE_TIMEOUT_SUGGEST_PARTNER:
             assert cache_entry is not None
             return cache_entry, 200
 
@@ -476,7 +487,7 @@ class SuggestPartnerResource(PathfinderResource):
         suggestions = token_network.suggest_partner(
             self.pathfinding_service.matrix_listener.user_manager
         )
-        self.cache[cache_key] = (suggestions, datetime.utcnow())
+        self.cache[cache_key] = (suggestions, now)
 
         return suggestions, 200
 
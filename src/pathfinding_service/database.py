@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
+import orjson
 import structlog
 from eth_utils import to_canonical_address, to_checksum_address
 
@@ -27,6 +28,12 @@ from raiden_libs.database import BaseDatabase, hex256
 
 log = structlog.get_logger(__name__)
 
+# Building a marshmallow schema is expensive compared to using it, so the
+# schemas used for every channel and IOU update are created only once.
+CHANNEL_SCHEMA = Channel.Schema()
+IOU_SCHEMA = IOU.Schema()
+IOU_DB_SCHEMA = IOU.Schema(exclude=["receiver", "chain_id"])
+
 
 class PFSDatabase(BaseDatabase):
     """ Store data that needs to persist between PFS restarts """
@@ -104,7 +111,7 @@ class PFSDatabase(BaseDatabase):
         )
 
     def upsert_iou(self, iou: IOU) -> None:
-        iou_dict = IOU.Schema(exclude=["receiver", "chain_id"]).dump(iou)
+        iou_dict = IOU_DB_SCHEMA.dump(iou)
         iou_dict["one_to_n_address"] = to_checksum_address(iou_dict["one_to_n_address"])
         for key in ("amount", "expiration_block"):
             iou_dict[key] = hex256(int(iou_dict[key]))
@@ -147,7 +154,7 @@ class PFSDatabase(BaseDatabase):
         for row in self.conn.execute(query, args):
             iou_dict = dict(zip(row.keys(), row))
             iou_dict["receiver"] = to_checksum_address(self.pfs_address)
-            yield IOU.Schema().load(iou_dict)
+            yield IOU_SCHEMA.load(iou_dict)
 
     def get_nof_claimed_ious(self) -> int:
         query = """
@@ -172,7 +179,7 @@ class PFSDatabase(BaseDatabase):
             return None
 
     def upsert_channel(self, channel: Channel) -> None:
-        channel_dict = Channel.Schema().dump(channel)
+        channel_dict = CHANNEL_SCHEMA.dump(channel)
         for key in (
             "channel_id",
             "settle_timeout",
@@ -193,7 +200,7 @@ class PFSDatabase(BaseDatabase):
             channel_dict = dict(zip(row.keys(), row))
             channel_dict["fee_schedule1"] = json.loads(channel_dict["fee_schedule1"])
             channel_dict["fee_schedule2"] = json.loads(channel_dict["fee_schedule2"])
-            yield Channel.Schema().load(channel_dict)
+            yield CHANNEL_SCHEMA.load(channel_dict)
 
     def delete_channel(
         self, token_network_address: TokenNetworkAddress, channel_id: ChannelID
@@ -290,7 +297,9 @@ class PFSDatabase(BaseDatabase):
 
         for row in self.conn.execute(sql, filters):
             route = dict(zip(row.keys(), row))
-            route["route"] = json.loads(route["route"])
+            # The stored route must keep the `json.dumps` format, since it is part
+            # of the primary key. Decoding is format independent, so orjson is fine.
+            route["route"] = orjson.loads(route["route"])
             yield route
 
     def get_feedback_token(
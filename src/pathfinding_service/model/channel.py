@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import ClassVar, Tuple, Type
 
@@ -30,8 +30,9 @@ class FeeSchedule(FeeScheduleRaiden):
 
     @classmethod
     def from_raiden(cls, fee_schedule: FeeScheduleRaiden, timestamp: datetime) -> "FeeSchedule":
-        kwargs = asdict(fee_schedule)
-        kwargs.pop("_penalty_func")
+        # Copy only the init fields instead of using `asdict`, which deep copies
+        # the whole schedule and includes the derived `_penalty_func`
+        kwargs = {f.name: getattr(fee_schedule, f.name) for f in fields(fee_schedule) if f.init}
         return FeeSchedule(timestamp=timestamp, **kwargs)
 
 
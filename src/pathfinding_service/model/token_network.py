@@ -66,6 +66,9 @@ def prune_graph(graph: DiGraph, reachability_state: AddressReachabilityProtocol)
 
 
 class Path:
+    # Many candidate paths are created for each route request
+    __slots__ = ("G", "nodes", "value", "reachability_state", "fees", "is_valid")
+
     def __init__(
         self,
         G: DiGraph,
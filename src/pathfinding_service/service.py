@@ -2,7 +2,7 @@ import collections
 import sys
 import time
 from dataclasses import asdict
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Type
 
 import gevent
 import sentry_sdk
@@ -225,16 +225,9 @@ class PathfindingService(gevent.Greenlet):
         with sentry_sdk.configure_scope() as scope:
             with metrics.collect_event_metrics(event):
                 scope.set_extra("event", event)
-                if isinstance(event, ReceiveTokenNetworkCreatedEvent):
-                    self.handle_token_network_created(event)
-                elif isinstance(event, ReceiveChannelOpenedEvent):
-                    self.handle_channel_opened(event)
-                elif isinstance(event, ReceiveChannelClosedEvent):
-                    self.handle_channel_closed(event)
-                elif isinstance(event, UpdatedHeadBlockEvent):
-                    # TODO: Store blockhash here as well
-                    self.blockchain_state.latest_committed_block = event.head_block_number
-                    self.database.update_lastest_committed_block(event.head_block_number)
+                handler_name = EVENT_HANDLERS.get(type(event))
+                if handler_name:
+                    getattr(self, handler_name)(event)
                 else:
                     log.debug("Unhandled event", evt=event)
 
@@ -272,6 +265,11 @@ class PathfindingService(gevent.Greenlet):
                 log.debug("Processing deferred message", message=message)
                 self.handle_message(message)
 
+    def handle_updated_head_block(self, event: UpdatedHeadBlockEvent) -> None:
+        # TODO: Store blockhash here as well
+        self.blockchain_state.latest_committed_block = event.head_block_number
+        self.database.update_lastest_committed_block(event.head_block_number)
+
     def handle_channel_closed(self, event: ReceiveChannelClosedEvent) -> None:
         token_network = self.get_token_network(event.token_network_address)
         if token_network is None:
@@ -297,14 +295,13 @@ class PathfindingService(gevent.Greenlet):
             scope.set_extra("message", message)
             try:
                 with metrics.collect_message_metrics(message):
-                    if isinstance(message, PFSCapacityUpdate):
-                        changed_channel: Optional[Channel] = self.on_capacity_update(message)
-                    elif isinstance(message, PFSFeeUpdate):
-                        changed_channel = self.on_fee_update(message)
-                    else:
+                    handler_name = MESSAGE_HANDLERS.get(type(message))
+                    if handler_name is None:
                         log.debug("Ignoring message", unknown_message=message)
                         return
 
+                    changed_channel: Optional[Channel] = getattr(self, handler_name)(message)
+
                     if changed_channel:
                         self.database.upsert_channel(changed_channel)
 
@@ -414,3 +411,18 @@ class PathfindingService(gevent.Greenlet):
             updating_capacity_partner=updating_capacity_partner,
             other_capacity_partner=other_capacity_partner,
         )
+
+
+# Handlers are referenced by name, so that they are looked up on the instance
+# and can be replaced there (e.g. in tests).
+EVENT_HANDLERS: Dict[Type[Event], str] = {
+    ReceiveTokenNetworkCreatedEvent: "handle_token_network_created",
+    ReceiveChannelOpenedEvent: "handle_channel_opened",
+    ReceiveChannelClosedEvent: "handle_channel_closed",
+    UpdatedHeadBlockEvent: "handle_updated_head_block",
+}
+
+MESSAGE_HANDLERS: Dict[Type[Message], str] = {
+    PFSCapacityUpdate: "on_capacity_update",
+    PFSFeeUpdate: "on_fee_update",
+}
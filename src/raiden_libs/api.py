@@ -1,5 +1,9 @@
+import json
+from typing import Any, Dict, Optional
+
+import orjson
 import structlog
-from flask import Response
+from flask import Response, make_response
 from flask_restful import Api
 
 from raiden_libs.exceptions import ApiException
@@ -7,7 +11,31 @@ from raiden_libs.exceptions import ApiException
 log = structlog.get_logger(__name__)
 
 
+def output_json(data: Any, code: int, headers: Optional[Dict] = None) -> Response:
+    """Serializes API responses with `orjson`
+
+    `orjson` only supports integers up to 64 bits, but some responses contain
+    uint256 token amounts (e.g. IOUs above ~18.4 tokens with 18 decimals). For
+    those, `orjson` fails and the response is encoded a second time with the
+    stdlib `json` module, which makes them slightly slower than before.
+
+    Like flask-restful's default representation, a trailing newline is added.
+    """
+    try:
+        dumped = orjson.dumps(data)
+    except orjson.JSONEncodeError:
+        dumped = json.dumps(data).encode()
+
+    response = make_response(dumped + b"\n", code)
+    response.headers.extend(headers or {})
+    return response
+
+
 class ApiWithErrorHandler(Api):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.representations["application/json"] = output_json
+
     def handle_error(self, e: Exception) -> Response:
         if isinstance(e, ApiException):
             log.warning(
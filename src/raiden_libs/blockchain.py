@@ -1,4 +1,5 @@
 import time
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import structlog
@@ -28,7 +29,7 @@ from raiden_contracts.constants import (
     ChannelEvent,
     MonitoringServiceEvent,
 )
-from raiden_libs.contract_info import CONTRACT_MANAGER
+from raiden_libs.contract_info import get_contract_manager
 from raiden_libs.events import (
     Event,
     ReceiveChannelClosedEvent,
@@ -45,6 +46,7 @@ from raiden_libs.states import BlockchainState
 log = structlog.get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
 def create_event_topic_to_abi_dict() -> Dict[bytes, ABIEvent]:
     contract_names = [
         CONTRACT_TOKEN_NETWORK_REGISTRY,
@@ -54,7 +56,7 @@ def create_event_topic_to_abi_dict() -> Dict[bytes, ABIEvent]:
 
     event_abis = {}
     for contract_name in contract_names:
-        events = filter_by_type("event", CONTRACT_MANAGER.get_contract_abi(contract_name))
+        events = filter_by_type("event", get_contract_manager().get_contract_abi(contract_name))
 
         for event_abi in events:
             event_topic = event_abi_to_log_topic(event_abi)  # type: ignore
@@ -63,9 +65,6 @@ def create_event_topic_to_abi_dict() -> Dict[bytes, ABIEvent]:
     return event_abis  # type: ignore
 
 
-EVENT_TOPIC_TO_ABI = create_event_topic_to_abi_dict()
-
-
 def get_web3_provider_info(web3: Web3) -> str:
     """Returns information about the provider
 
@@ -85,7 +84,7 @@ def get_web3_provider_info(web3: Web3) -> str:
 
 def decode_event(abi_codec: ABICodec, log_entry: LogReceipt) -> Dict:
     topic = log_entry["topics"][0]
-    event_abi = EVENT_TOPIC_TO_ABI[topic]
+    event_abi = create_event_topic_to_abi_dict()[topic]
 
     return get_event_data(abi_codec=abi_codec, event_abi=event_abi, log_entry=log_entry)
 
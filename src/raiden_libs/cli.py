@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 import os
 import sys
@@ -8,6 +7,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import click
 import gevent
+import orjson
 import pkg_resources
 import requests.exceptions
 import sentry_sdk
@@ -35,17 +35,17 @@ from raiden_contracts.constants import (
     CONTRACTS_VERSION,
 )
 from raiden_contracts.utils.type_aliases import PrivateKey
-from raiden_libs.contract_info import CONTRACT_MANAGER, get_contract_addresses_and_start_block
+from raiden_libs.contract_info import get_contract_addresses_and_start_block, get_contract_manager
 from raiden_libs.logging import setup_logging
 
 log = structlog.get_logger(__name__)
 
 
 def _open_keystore(keystore_file: str, password: str) -> PrivateKey:
-    with open(keystore_file, "r") as keystore:
+    with open(keystore_file, "rb") as keystore:
         try:
             private_key = bytes(
-                Account.decrypt(keyfile_json=json.load(keystore), password=password)
+                Account.decrypt(keyfile_json=orjson.loads(keystore.read()), password=password)
             )
             return PrivateKey(private_key)
         except ValueError as error:
@@ -286,7 +286,7 @@ def connect_to_blockchain(
         chain_id=chain_id, contracts=used_contracts, address_overwrites=address_overwrites
     )
     contracts = {
-        c: web3.eth.contract(abi=CONTRACT_MANAGER.get_contract_abi(c), address=address)
+        c: web3.eth.contract(abi=get_contract_manager().get_contract_abi(c), address=address)
         for c, address in addresses.items()
     }
 
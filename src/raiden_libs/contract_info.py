@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 import structlog
@@ -12,7 +13,16 @@ from raiden_contracts.contract_manager import (
 )
 
 log = structlog.get_logger(__name__)
-CONTRACT_MANAGER = ContractManager(contracts_precompiled_path())
+
+
+@lru_cache(maxsize=1)
+def get_contract_manager() -> ContractManager:
+    """Returns the shared `ContractManager`
+
+    Loading the precompiled contracts is slow, so it is done on first use
+    instead of on import. This keeps CLI startup and test collection fast.
+    """
+    return ContractManager(contracts_precompiled_path())
 
 
 def get_contract_addresses_and_start_block(
@@ -67,9 +67,10 @@ class RateLimiter:
         self.bytes_processed_for: Dict[Address, int] = {}
 
     def reset_if_it_is_time(self) -> None:
-        if datetime.utcnow() >= self.next_reset:
+        now = datetime.utcnow()
+        if now >= self.next_reset:
             self.bytes_processed_for = {}
-            self.next_reset = datetime.utcnow() + self.reset_interval
+            self.next_reset = now + self.reset_interval
 
     def check_and_count(self, sender: Address, added_bytes: int) -> bool:
         new_total = self.bytes_processed_for.get(sender, 0) + added_bytes
@@ -95,12 +96,19 @@ def deserialize_messages(
             log.warning("Sender is rate limited", sender=peer_address)
             return []
 
+    # Bind the logger once per batch, the checksum encoding needs a keccak hash
+    logger = log.bind(peer_address=to_checksum_address(peer_address))
     for line in data.splitlines():
         line = line.strip()
         if not line:
             continue
 
-        logger = log.bind(peer_address=to_checksum_address(peer_address))
+        # Every Raiden message is a JSON object, skip the full deserialization
+        # for anything else
+        if line[0] != "{":
+            logger.warning("Message data is not a JSON object", message_data=line)
+            continue
+
         try:
             message = MessageSerializer.deserialize(line)
         except (SerializationError, ValidationError, KeyError, ValueError) as ex:
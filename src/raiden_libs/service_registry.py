@@ -30,7 +30,7 @@ from raiden_contracts.constants import (
 from raiden_libs.blockchain import get_web3_provider_info
 from raiden_libs.cli import blockchain_options, common_options, validate_address
 from raiden_libs.constants import CONFIRMATION_OF_UNDERSTANDING
-from raiden_libs.contract_info import CONTRACT_MANAGER
+from raiden_libs.contract_info import get_contract_manager
 from raiden_libs.utils import private_key_to_address
 
 log = structlog.get_logger(__name__)
@@ -363,7 +363,7 @@ def register_account(
     deposit_token_address = service_registry_contract.functions.token().call()
     deposit_token_contract = web3.eth.contract(
         address=deposit_token_address,
-        abi=CONTRACT_MANAGER.get_contract_abi(CONTRACT_CUSTOM_TOKEN),
+        abi=get_contract_manager().get_contract_abi(CONTRACT_CUSTOM_TOKEN),
     )
 
     click.secho(
@@ -498,7 +498,7 @@ def find_withdrawable_deposit(
     deposit_token_address = service_registry_contract.functions.token().call()
     deposit_token_contract = web3.eth.contract(
         address=deposit_token_address,
-        abi=CONTRACT_MANAGER.get_contract_abi(CONTRACT_CUSTOM_TOKEN),
+        abi=get_contract_manager().get_contract_abi(CONTRACT_CUSTOM_TOKEN),
     )
     fmt_amount = get_token_formatter(deposit_token_contract)
 
@@ -541,7 +541,8 @@ def withdraw(
         start_block=start_block,
     )
     deposit_contract = web3.eth.contract(
-        abi=CONTRACT_MANAGER.get_contract_abi(CONTRACT_DEPOSIT), address=deposit_contract_address
+        abi=get_contract_manager().get_contract_abi(CONTRACT_DEPOSIT),
+        address=deposit_contract_address,
     )
 
     # Check usage of correct key
@@ -611,7 +612,7 @@ def info(
     deposit_token_address = service_registry_contract.functions.token().call()
     deposit_token_contract = web3.eth.contract(
         address=deposit_token_address,
-        abi=CONTRACT_MANAGER.get_contract_abi(CONTRACT_CUSTOM_TOKEN),
+        abi=get_contract_manager().get_contract_abi(CONTRACT_CUSTOM_TOKEN),
     )
     caller_address = private_key_to_address(private_key)
     fmt_amount = get_token_formatter(deposit_token_contract)
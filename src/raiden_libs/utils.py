@@ -1,3 +1,7 @@
+from functools import lru_cache
+from typing import Any
+
+import eth_utils
 from coincurve import PrivateKey, PublicKey
 from eth_utils import keccak
 
@@ -19,3 +23,21 @@ def private_key_to_address(private_key: PrivateKeyType) -> Address:
     """ Converts a private key to an Ethereum address. """
     privkey = PrivateKey(private_key)
     return public_key_to_address(privkey.public_key)
+
+
+@lru_cache(maxsize=4096)
+def _is_checksum_address(value: str) -> bool:
+    return eth_utils.is_checksum_address(value)
+
+
+def is_checksum_address(value: Any) -> bool:
+    """Same as `eth_utils.is_checksum_address`, but caches results.
+
+    Checking the checksum requires a keccak hash of the address. The same
+    addresses show up in many API requests, so caching avoids most of these.
+    Malformed values are rejected before the cache, so arbitrary client input
+    is never stored in it.
+    """
+    if not isinstance(value, str) or len(value) != 42 or not eth_utils.is_hex_address(value):
+        return False
+    return _is_checksum_address(value)
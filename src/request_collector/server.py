@@ -126,18 +126,18 @@ class RequestCollector(gevent.Greenlet):
             return
 
         # Check that received MR is newer by comparing nonces
-        old_mr = self.state_db.get_monitor_request(
+        old_nonce = self.state_db.get_monitor_request_nonce(
             token_network_address=monitor_request.token_network_address,
             channel_id=monitor_request.channel_identifier,
             non_closing_signer=monitor_request.non_closing_signer,
         )
-        if old_mr and old_mr.nonce >= monitor_request.nonce:
+        if old_nonce is not None and old_nonce >= monitor_request.nonce:
             log.debug(
                 "New MR does not have a newer nonce.",
                 token_network_address=monitor_request.token_network_address,
                 channel_identifier=monitor_request.channel_identifier,
                 received_nonce=monitor_request.nonce,
-                known_nonce=old_mr.nonce,
+                known_nonce=old_nonce,
             )
             return
 
@@ -0,0 +1,21 @@
+import json
+
+from flask import Flask
+
+from raiden.constants import UINT256_MAX
+from raiden_libs.api import output_json
+
+
+def test_output_json():
+    with Flask(__name__).app_context():
+        response = output_json({"a": [1, "b"]}, 200, headers={"X-Foo": "bar"})
+        assert response.status_code == 200
+        assert response.headers["X-Foo"] == "bar"
+        assert json.loads(response.get_data()) == {"a": [1, "b"]}
+        assert response.get_data().endswith(b"\n")
+
+        # uint256 values are not supported by orjson
+        response = output_json({"amount": UINT256_MAX}, 400)
+        assert response.status_code == 400
+        assert json.loads(response.get_data()) == {"amount": UINT256_MAX}
+        assert response.get_data().endswith(b"\n")
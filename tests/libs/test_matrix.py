@@ -134,6 +134,16 @@ def test_deserialize_messages_with_missing_fields(request_monitoring_message):
         assert len(messages) == 0
 
 
+def test_deserialize_messages_that_are_no_json_objects(request_monitoring_message):
+    message = MessageSerializer.serialize(request_monitoring_message)
+    raw_string = "\n".join([message, "[" + message + "]", "not json", '"string"', message])
+
+    messages = deserialize_messages(
+        data=raw_string, peer_address=request_monitoring_message.sender
+    )
+    assert len(messages) == 2
+
+
 def test_deserialize_messages_that_is_too_big(request_monitoring_message, capsys):
 
     data = str(b"/0" * 1000000)
@@ -0,0 +1,40 @@
+import eth_utils
+import pytest
+
+from raiden_libs.utils import is_checksum_address
+
+CHECKSUM_ADDRESS = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        # not a string
+        None,
+        42,
+        bytes(20),
+        [CHECKSUM_ADDRESS],
+        # malformed or overlong strings
+        "",
+        "0x",
+        "not an address",
+        CHECKSUM_ADDRESS[2:],
+        CHECKSUM_ADDRESS[:-1],
+        CHECKSUM_ADDRESS + "00",
+        "0x" + "g" * 40,
+        CHECKSUM_ADDRESS * 1000,
+        # well formed addresses
+        CHECKSUM_ADDRESS,
+        CHECKSUM_ADDRESS.lower(),
+        CHECKSUM_ADDRESS.upper().replace("0X", "0x"),
+    ],
+)
+def test_is_checksum_address(value):
+    assert is_checksum_address(value) == eth_utils.is_checksum_address(value)
+
+
+def test_is_checksum_address_results():
+    assert is_checksum_address(CHECKSUM_ADDRESS)
+    assert not is_checksum_address(CHECKSUM_ADDRESS.lower())
+    assert not is_checksum_address(CHECKSUM_ADDRESS * 1000)
+    assert not is_checksum_address(None)
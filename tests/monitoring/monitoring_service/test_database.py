@@ -98,6 +98,22 @@ def test_save_and_load_monitor_request(ms_database: Database):
 
     assert restored == request
 
+    nonce = ms_database.get_monitor_request_nonce(
+        token_network_address=request.token_network_address,
+        channel_id=request.channel_identifier,
+        non_closing_signer=request.non_closing_signer,
+    )
+    assert nonce == request.nonce
+
+    assert (
+        ms_database.get_monitor_request_nonce(
+            token_network_address=request.token_network_address,
+            channel_id=ChannelID(request.channel_identifier + 1),
+            non_closing_signer=request.non_closing_signer,
+        )
+        is None
+    )
+
 
 def test_save_and_load_channel(ms_database: Database):
     ms_database.conn.execute(
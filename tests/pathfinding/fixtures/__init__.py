@@ -9,10 +9,13 @@ from .api import *  # noqa
 from .iou import *  # noqa
 from .network_service import *  # noqa
 
+DEFAULT_TOKEN_NETWORK_ADDRESS = TokenNetworkAddress(b"\x01" * 20)
 
+
+# Most tests add channels to the token network, so it can't be shared between tests
 @pytest.fixture
 def token_network_model() -> TokenNetwork:
-    return TokenNetwork(TokenNetworkAddress(bytes([1] * 20)))
+    return TokenNetwork(DEFAULT_TOKEN_NETWORK_ADDRESS)
 
 
 @pytest.fixture